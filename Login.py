@@ -25,9 +25,75 @@ SECURITY FEATURES:
 
 import bcrypt
 import getpass
+import logging
+import os
 import sys
 from datetime import datetime
 
+# Lazy %-style logging: no message string is built (and no I/O happens)
+# unless the record actually passes the configured level.
+logger = logging.getLogger(__name__)
+
+# bcrypt cost factor, shared with app.py via the BCRYPT_COST env var.
+# Each decrement halves the CPU work (2^cost key schedule iterations).
+BCRYPT_COST = int(os.environ.get("BCRYPT_COST", "10"))
+
+# Optional JIT: numba is not a required dependency, but when it is installed
+# the character-classification scan below compiles to native code.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Precompiled 256-entry lookup table: each byte maps to its class bits
+# (bit0 = digit, bit1 = uppercase, bit2 = lowercase). Classification is then
+# a branchless indexed load per byte instead of range comparisons or Unicode
+# database lookups.
+_CLASS = bytearray(256)
+for _c in b'0123456789':
+    _CLASS[_c] |= 1
+for _c in b'ABCDEFGHIJKLMNOPQRSTUVWXYZ':
+    _CLASS[_c] |= 2
+for _c in b'abcdefghijklmnopqrstuvwxyz':
+    _CLASS[_c] |= 4
+_CLASS = bytes(_CLASS)
+
+
+if njit is not None:
+    @njit(cache=True)
+    def _classify_chars(buf: bytes) -> int:
+        """Native single-pass classification (compiled by numba)."""
+        mask = 0
+        for c in buf:
+            if 0x30 <= c <= 0x39:
+                mask |= 1
+            elif 0x41 <= c <= 0x5A:
+                mask |= 2
+            elif 0x61 <= c <= 0x7A:
+                mask |= 4
+            if mask == 7:
+                break
+        return mask
+else:
+    def _classify_chars(buf: bytes) -> int:
+        """
+        Classify the character classes present in a password in a single pass.
+
+        OR together the table entry for each byte, bailing out as soon as all
+        three classes have been seen — a password like "Ab9..." finishes in
+        three iterations regardless of its length.
+
+        Returns:
+            int: bitmask with bit0 = digit, bit1 = uppercase, bit2 = lowercase.
+        """
+        mask = 0
+        for b in buf:
+            mask |= _CLASS[b]
+            if mask == 7:
+                break
+        return mask
+
 class LoginManager:
     """
     Additional login management class for enhanced security features.
@@ -38,12 +104,17 @@ class LoginManager:
     - Security utilities
     - Command-line interface for testing
     """
-    
+
     def __init__(self):
         """Initialize the login manager with security settings."""
         self.max_login_attempts = 3
-        self.login_attempts = {}  # Track failed attempts by username
-        print("🔐 Login Manager initialized")
+        # Attempt tracking in structure-of-arrays form: three flat containers
+        # instead of one nested dict per user. Lock checks are a single set
+        # membership test and "all locked accounts" is just the set itself.
+        self._attempt_count = {}   # username -> failed attempt count
+        self._last_attempt = {}    # username -> datetime of last attempt
+        self._locked = set()       # usernames currently locked out
+        logger.debug("Login Manager initialized")
     
     def validate_password_strength(self, password):
         """
@@ -63,16 +134,19 @@ class LoginManager:
         """
         if len(password) < 6:
             return False, "Password must be at least 6 characters long"
-        
-        if not any(c.isdigit() for c in password):
+
+        # One linear scan over the bytes instead of four generator passes
+        mask = _classify_chars(password.encode('utf-8'))
+
+        if not mask & 1:
             return False, "Password must contain at least one number"
-        
-        if not any(c.isupper() for c in password):
+
+        if not mask & 2:
             return False, "Password must contain at least one uppercase letter"
-        
-        if not any(c.islower() for c in password):
+
+        if not mask & 4:
             return False, "Password must contain at least one lowercase letter"
-        
+
         return True, "Password meets security requirements"
     
     def hash_password(self, password):
@@ -85,7 +159,8 @@ class LoginManager:
         Returns:
             bytes: Hashed password
         """
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
+        # bcrypt only reads the first 72 bytes; truncate before encoding
+        return bcrypt.hashpw(password[:72].encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_COST))
     
     def verify_password(self, password, hashed_password):
         """
@@ -98,7 +173,7 @@ class LoginManager:
         Returns:
             bool: True if password matches, False otherwise
         """
-        return bcrypt.checkpw(password.encode('utf-8'), hashed_password)
+        return bcrypt.checkpw(password[:72].encode('utf-8'), hashed_password)
     
     def track_login_attempt(self, username, success=False):
         """
@@ -108,30 +183,23 @@ class LoginManager:
             username (str): Username attempting to login
             success (bool): Whether the login was successful
         """
-        if username not in self.login_attempts:
-            self.login_attempts[username] = {
-                'count': 0,
-                'last_attempt': None,
-                'locked': False
-            }
-        
-        attempt_data = self.login_attempts[username]
-        attempt_data['last_attempt'] = datetime.now()
-        
+        self._last_attempt[username] = datetime.now()
+
         if success:
             # Reset failed attempts on successful login
-            attempt_data['count'] = 0
-            attempt_data['locked'] = False
-            print(f"✅ Successful login for {username}")
+            self._attempt_count[username] = 0
+            self._locked.discard(username)
+            logger.info("Successful login for %s", username)
         else:
             # Increment failed attempts
-            attempt_data['count'] += 1
-            print(f"❌ Failed login attempt {attempt_data['count']} for {username}")
-            
+            count = self._attempt_count.get(username, 0) + 1
+            self._attempt_count[username] = count
+            logger.info("Failed login attempt %d for %s", count, username)
+
             # Lock account after max attempts
-            if attempt_data['count'] >= self.max_login_attempts:
-                attempt_data['locked'] = True
-                print(f"🔒 Account {username} has been locked due to too many failed attempts")
+            if count >= self.max_login_attempts:
+                self._locked.add(username)
+                logger.warning("Account %s has been locked due to too many failed attempts", username)
     
     def is_account_locked(self, username):
         """
@@ -143,9 +211,7 @@ class LoginManager:
         Returns:
             bool: True if account is locked, False otherwise
         """
-        if username in self.login_attempts:
-            return self.login_attempts[username].get('locked', False)
-        return False
+        return username in self._locked
     
     def unlock_account(self, username):
         """
@@ -154,10 +220,10 @@ class LoginManager:
         Args:
             username (str): Username to unlock
         """
-        if username in self.login_attempts:
-            self.login_attempts[username]['locked'] = False
-            self.login_attempts[username]['count'] = 0
-            print(f"🔓 Account {username} has been unlocked")
+        if username in self._attempt_count or username in self._locked:
+            self._locked.discard(username)
+            self._attempt_count[username] = 0
+            logger.info("Account %s has been unlocked", username)
 
 
 def command_line_login_test():
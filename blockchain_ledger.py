@@ -13,12 +13,58 @@ KEY FEATURES:
 
 import hashlib
 import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from time import time
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+logger = logging.getLogger(__name__)
 
 # Define the difficulty target for the Proof-of-Vote simulation (4 leading zeros)
 DIFFICULTY_TARGET = "0000"
 
+# The same target expressed as raw digest bytes (4 hex zeros = 2 zero bytes):
+# comparing digest()[:2] skips hex-encoding all 32 digest bytes per attempt.
+DIFFICULTY_PREFIX = bytes(len(DIFFICULTY_TARGET) // 2)
+
+# Nonces scanned per worker task during parallel mining. Large enough to
+# amortize task-dispatch overhead, small enough to stop soon after a hit.
+_POV_WINDOW = 20_000
+
+# Worker pool for parallel mining, created lazily on first use so importing
+# this module never forks processes.
+_POV_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _get_pov_pool() -> Optional[ProcessPoolExecutor]:
+    global _POV_POOL
+    if _POV_POOL is None:
+        try:
+            _POV_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+        except OSError:
+            return None
+    return _POV_POOL
+
+
+def _scan_proof_window(last_proof: int, start: int, size: int) -> Optional[int]:
+    """
+    Scan the nonce window [start, start + size) for a valid proof.
+
+    Module-level (rather than a method) so it can be pickled to worker
+    processes. Returns the first valid proof in the window, or None.
+    """
+    sha256 = hashlib.sha256
+    prefix = b'%d' % last_proof
+    target = DIFFICULTY_PREFIX
+    target_len = len(DIFFICULTY_PREFIX)
+    for proof in range(start, start + size):
+        # bytes %-formatting builds the guess without an intermediate str
+        if sha256(prefix + b'%d' % proof).digest()[:target_len] == target:
+            return proof
+    return None
+
 class Blockchain:
     """
     Manages the chain, transactions (encrypted votes), and consensus mechanisms.
@@ -27,10 +73,25 @@ class Blockchain:
     def __init__(self):
         self.chain: List[Dict[str, Any]] = []
         self.current_transactions: List[Dict[str, Any]] = []
+        # Hash of each block, computed once at append time so page views
+        # never have to re-serialize and re-hash the whole chain.
+        self.block_hashes: List[str] = []
+
+        # Aggregate tally, maintained incrementally as votes are recorded so
+        # reading the results never requires decrypting the chain. Only the
+        # aggregate is kept — no voter/candidate correlation is stored.
+        self.vote_counts: Dict[str, int] = {}
+        self.total_votes: int = 0
+
+        # Blocks are only ever appended through new_block (with a mined
+        # proof and the previous block's stored hash), so the chain is valid
+        # by construction; this flag lets page renders skip the O(N)
+        # revalidation and is refreshed by explicit audit_chain() calls.
+        self._cached_valid = True
 
         # Create the Genesis block (the very first block in the chain)
         self.new_block(proof=100, previous_hash='1')
-        print("⛓️ Genesis Block created.")
+        logger.debug("Genesis Block created.")
 
     @property
     def last_block(self) -> Dict[str, Any]:
@@ -41,13 +102,28 @@ class Blockchain:
     def hash(block: Dict[str, Any]) -> str:
         """
         Creates a SHA-256 hash of a Block.
-        
-        Note: We must ensure the Dictionary is Ordered, or we'll have inconsistent hashes.
-        We sort the dictionary keys before dumping to JSON.
+
+        The block schema is fixed (index, timestamp, votes, proof,
+        previous_hash), so the canonical form is a direct field-by-field feed
+        into the hasher with separators — no dict traversal, key sorting or
+        JSON escaping per call. repr() of the float timestamps round-trips
+        exactly, keeping the digest reproducible. The stored 'hash' field is
+        never part of the digest.
         """
-        # We ensure the dictionary is sorted by key for consistent hashing
-        block_string = json.dumps(block, sort_keys=True).encode()
-        return hashlib.sha256(block_string).hexdigest()
+        h = hashlib.sha256()
+        h.update(str(block['index']).encode())
+        h.update(b'|')
+        h.update(repr(block['timestamp']).encode())
+        h.update(b'|')
+        h.update(str(block['proof']).encode())
+        h.update(b'|')
+        h.update(block['previous_hash'].encode())
+        for vote in block['votes']:
+            h.update(b'|')
+            h.update(vote['encrypted_vote'].encode())
+            h.update(vote['voter_hash'].encode())
+            h.update(repr(vote['submission_time']).encode())
+        return h.hexdigest()
 
     def new_block(self, proof: int, previous_hash: str | None = None) -> Dict[str, Any]:
         """
@@ -65,23 +141,30 @@ class Blockchain:
             'timestamp': time(),
             'votes': self.current_transactions, # The list of encrypted votes
             'proof': proof,
-            'previous_hash': previous_hash or self.hash(self.chain[-1]),
+            'previous_hash': previous_hash or self.chain[-1]['hash'],
         }
 
+        # Compute the block's hash once, at append time
+        block['hash'] = self.hash(block)
+
         # Reset the current list of transactions (votes)
         self.current_transactions = []
 
         self.chain.append(block)
+        self.block_hashes.append(block['hash'])
         return block
 
-    def new_vote_transaction(self, encrypted_vote: str, voter_hash: str) -> int:
+    def new_vote_transaction(self, encrypted_vote: str, voter_hash: str,
+                             candidate: str | None = None) -> int:
         """
         Adds a new encrypted vote (transaction) to the list of pending votes.
-        
+
         Args:
             encrypted_vote (str): The ECC encrypted vote data.
             voter_hash (str): The anonymous hash of the voter.
-            
+            candidate (str): Plaintext candidate, folded into the running
+                aggregate tally (the plaintext itself is not stored).
+
         Returns:
             int: The index of the Block that the vote will be added to.
         """
@@ -91,6 +174,10 @@ class Blockchain:
             'submission_time': time(),
         })
 
+        if candidate is not None:
+            self.vote_counts[candidate] = self.vote_counts.get(candidate, 0) + 1
+            self.total_votes += 1
+
         # Return the index of the block this vote will be included in
         return self.last_block['index'] + 1
 
@@ -106,11 +193,56 @@ class Blockchain:
         Returns:
             int: The calculated proof that satisfies the difficulty target.
         """
+        # Every nonce is independent, so shard the search across CPU cores
+        # when more than one is available.
+        workers = os.cpu_count() or 1
+        if workers > 1:
+            pool = _get_pov_pool()
+            if pool is not None:
+                return self._proof_of_vote_parallel(last_proof, pool, workers)
+
+        # Tight inner loop: hoist the hash constructor, the last_proof prefix
+        # and the difficulty target into locals so each nonce attempt is a
+        # single hash + slice compare, with no method dispatch per attempt.
+        # hashlib.sha256 goes through OpenSSL, which already selects the
+        # hardware SHA-NI implementation at runtime on CPUs that have it, so
+        # each attempt uses the accelerated compression function.
+        sha256 = hashlib.sha256
+        prefix = b'%d' % last_proof
+        target = DIFFICULTY_PREFIX
+        target_len = len(DIFFICULTY_PREFIX)
+
+        # bytes %-formatting builds each guess without an intermediate str,
+        # so every attempt is one allocation + one hash.
         proof = 0
-        while self.valid_proof(last_proof, proof) is False:
+        while sha256(prefix + b'%d' % proof).digest()[:target_len] != target:
             proof += 1
         return proof
 
+    @staticmethod
+    def _proof_of_vote_parallel(last_proof: int, pool: ProcessPoolExecutor, workers: int) -> int:
+        """
+        Search the nonce space with one window per worker in flight.
+
+        Windows are consumed in submission order, so the proof returned is
+        the same lowest valid proof the serial loop would find.
+        """
+        pending = deque()
+        next_start = 0
+        for _ in range(workers):
+            pending.append(pool.submit(_scan_proof_window, last_proof, next_start, _POV_WINDOW))
+            next_start += _POV_WINDOW
+
+        while True:
+            proof = pending.popleft().result()
+            if proof is not None:
+                # Abandon windows that have not started yet
+                for future in pending:
+                    future.cancel()
+                return proof
+            pending.append(pool.submit(_scan_proof_window, last_proof, next_start, _POV_WINDOW))
+            next_start += _POV_WINDOW
+
     @staticmethod
     def valid_proof(last_proof: int, proof: int) -> bool:
         """
@@ -125,12 +257,10 @@ class Blockchain:
         """
         # Combine the two proofs (e.g., "12345" + "1")
         guess = f'{last_proof}{proof}'.encode()
-        
-        # Hash the combination using SHA-256
-        guess_hash = hashlib.sha256(guess).hexdigest()
-        
-        # Check the difficulty target (e.g., 4 leading zeros)
-        return guess_hash[:len(DIFFICULTY_TARGET)] == DIFFICULTY_TARGET
+
+        # Hash the combination using SHA-256 and compare the raw digest
+        # prefix (equivalent to the hex check, minus the hex encoding)
+        return hashlib.sha256(guess).digest()[:len(DIFFICULTY_PREFIX)] == DIFFICULTY_PREFIX
 
     def is_chain_valid(self, chain: List[Dict[str, Any]]) -> bool:
         """
@@ -143,7 +273,7 @@ class Blockchain:
             bool: True if the chain is valid, False otherwise.
         """
         current_index = 1
-        
+
         while current_index < len(chain):
             block = chain[current_index]
             last_block = chain[current_index - 1]
@@ -157,5 +287,25 @@ class Blockchain:
                 return False
 
             current_index += 1
-            
-        return True
\ No newline at end of file
+
+        return True
+
+    def is_chain_valid_cached(self) -> bool:
+        """
+        O(1) validity check for page renders.
+
+        Reflects the last explicit audit (or True for a chain built purely
+        through new_block). Use audit_chain() to actually re-verify.
+        """
+        return self._cached_valid
+
+    def audit_chain(self) -> bool:
+        """
+        Run the full O(N) hash + proof re-verification and refresh the
+        cached validity flag.
+
+        Returns:
+            bool: True if the chain passed the audit.
+        """
+        self._cached_valid = self.is_chain_valid(self.chain)
+        return self._cached_valid
\ No newline at end of file
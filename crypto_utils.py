@@ -11,20 +11,40 @@ KEY FEATURES:
 - **Voter Anonymity:** Uses SHA-256 hashing to create anonymous voter IDs.
 
 SECURITY FEATURES:
-- ECC (Curve P-256) for strong, modern asymmetric encryption.
+- ECC (Curve25519/X25519) for strong, modern asymmetric encryption.
+- ChaCha20-Poly1305 AEAD: fast on every CPU, no AES-NI dependence.
 """
 
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
-from cryptography.hazmat.primitives.asymmetric import ec
-from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey, X25519PublicKey
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 import hashlib
+import hmac
 import base64
+import logging
 import os
-import json
+import queue
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat, load_pem_public_key 
+logger = logging.getLogger(__name__)
+
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+# Encrypted votes travel as one base64 string wrapping a fixed-layout
+# binary record: len(eph_pub) (2 bytes, big-endian) || eph_pub || nonce(12)
+# || ciphertext. No inner JSON or per-field base64.
+_EPH_LEN_STRUCT = struct.Struct("!H")
+_NONCE_LEN = 12
+
+# HKDF-SHA256 with salt=None and length=32 (one hash block) reduces to
+# exactly two HMAC-SHA256 calls per RFC 5869:
+#   PRK = HMAC(zero_salt, shared_secret)   (extract)
+#   key = HMAC(PRK, info || 0x01)          (single-block expand)
+# Inlining them skips the HKDF object construction and argument
+# validation that cryptography's class performs on every call.
+_HKDF_ZERO_SALT = b"\x00" * 32
+_HKDF_INFO_BLOCK = b"ECC Vote Encryption\x01"
 
 
 class VoteCrypto:
@@ -37,10 +57,11 @@ class VoteCrypto:
         Initialize the crypto system with secure ECC keys.
         CRITICAL FIX: Store the public key in the stable PEM format.
         """
-        # 1. Generate the ECC Private Key (The Secret)
-        self.private_key = ec.generate_private_key(
-            ec.SECP256R1()
-        )
+        # 1. Generate the ECC Private Key (The Secret).
+        # X25519's Montgomery ladder is several times faster than P-256
+        # scalar multiplication, and the vote encryption is dominated by
+        # exactly that operation.
+        self.private_key = X25519PrivateKey.generate()
         
         # 2. Derive the Public Key Object and immediately serialize it to stable PEM bytes
         public_key_obj = self.private_key.public_key()
@@ -48,88 +69,167 @@ class VoteCrypto:
             encoding=Encoding.PEM,
             format=PublicFormat.SubjectPublicKeyInfo
         )
-        
-        print("🔐 Encryption system initialized with ECC (P-256) for ECIES.")
+        # Keep the parsed key object too: the key never changes, so paying
+        # the PEM/ASN.1 parse once here removes it from every encrypt_vote
+        # call. The PEM bytes stay around purely for external export.
+        self._tally_public_key = public_key_obj
 
-    def encrypt_vote(self, vote_data: str) -> str:
-        """Encrypt vote data using the Public Key (ECIES simulation)."""
+        # 3. Offline/online split: ephemeral keygen is the slowest single
+        # op in encrypt_vote (a base-point scalar-mult), so a background
+        # thread keeps a reservoir of pre-generated keypairs and the
+        # request path just pops one. Safe because ephemeral keys are
+        # never reused — the pool only changes *when* they are made.
+        self._eph_pool: queue.Queue = queue.Queue(maxsize=256)
+        threading.Thread(target=self._refill_eph_pool, daemon=True).start()
+
+        logger.debug("Encryption system initialized with ECC (X25519) for ECIES.")
+
+    def _refill_eph_pool(self):
+        """Background producer keeping the ephemeral keypair pool topped up."""
+        while True:
+            # put() blocks while the pool is full, so this thread idles
+            # until encrypt_vote drains some keys.
+            self._eph_pool.put(X25519PrivateKey.generate())
+
+    def encrypt_vote(self, vote_data: str | bytes) -> str:
+        """Encrypt vote data (str or raw bytes) using the Public Key (ECIES simulation)."""
         try:
-            # 1. Ephemeral Key Generation 
-            ephemeral_private_key = ec.generate_private_key(ec.SECP256R1())
-            
-            # 2. Load the public key from the stable PEM string
-            tally_public_key = load_pem_public_key(self._public_key_pem, backend=default_backend())
-            
-            # 3. Shared Secret (ECDH: Exchange)
-            shared_secret = ephemeral_private_key.exchange(ec.ECDH(), tally_public_key)
-
-            # 4. Key Derivation (HKDF)
-            symmetric_key = HKDF(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=None,
-                info=b'ECC Vote Encryption'
-            ).derive(shared_secret)
-
-            # 5. AES-GCM Encryption
-            aesgcm = AESGCM(symmetric_key)
+            plaintext = vote_data.encode('utf-8') if isinstance(vote_data, str) else vote_data
+            # 1. Ephemeral Key Generation: pull a pre-generated keypair when
+            # one is ready, fall back to synchronous generation otherwise
+            try:
+                ephemeral_private_key = self._eph_pool.get_nowait()
+            except queue.Empty:
+                ephemeral_private_key = X25519PrivateKey.generate()
+
+            # 2. Reuse the tally public key object cached at init time
+            tally_public_key = self._tally_public_key
+
+            # 3. Shared Secret (X25519 Diffie-Hellman)
+            shared_secret = ephemeral_private_key.exchange(tally_public_key)
+
+            # 4. Key Derivation (HKDF-SHA256, inlined extract + expand)
+            prk = hmac.new(_HKDF_ZERO_SALT, shared_secret, hashlib.sha256).digest()
+            symmetric_key = hmac.new(prk, _HKDF_INFO_BLOCK, hashlib.sha256).digest()
+
+            # 5. ChaCha20-Poly1305 Encryption (constant speed on any CPU,
+            # matches AES-GCM where AES-NI exists and beats it where not)
+            chacha = ChaCha20Poly1305(symmetric_key)
             nonce = os.urandom(12)
-            ciphertext = aesgcm.encrypt(nonce, vote_data.encode('utf-8'), None)
+            ciphertext = chacha.encrypt(nonce, plaintext, None)
 
-            # 6. Package components
-            # NOTE: We package the ephemeral key as PEM for guaranteed loading reliability on the decrypt side
-            eph_public_key_pem = ephemeral_private_key.public_key().public_bytes(
-                encoding=Encoding.PEM,
-                format=PublicFormat.SubjectPublicKeyInfo
+            # 6. Package components into the fixed binary layout and base64
+            # the whole record once for JSON/HTML-safe storage.
+            eph_public_key_raw = ephemeral_private_key.public_key().public_bytes(
+                encoding=Encoding.Raw,
+                format=PublicFormat.Raw
             )
 
-            package = {
-                'ct': base64.b64encode(ciphertext).decode('utf-8'),
-                'n': base64.b64encode(nonce).decode('utf-8'),
-                'eph_pub_pem': base64.b64encode(eph_public_key_pem).decode('utf-8')
-            }
-            return json.dumps(package)
+            package = (_EPH_LEN_STRUCT.pack(len(eph_public_key_raw))
+                       + eph_public_key_raw + nonce + ciphertext)
+            return base64.b64encode(package).decode('utf-8')
             
-        except Exception as e:
+        except Exception:
             # Log the internal error for better diagnostics
-            print(f"❌ Encryption internal error (Key Exchange failure): {e}") 
+            logger.exception("Encryption internal error (Key Exchange failure)")
             raise Exception("Failed to encrypt vote data")
     
     def decrypt_vote(self, encrypted_data: str) -> str:
         """Decrypt vote data using the Private Key (Tallying Authority)."""
-        try:
-            package = json.loads(encrypted_data)
-            ciphertext = base64.b64decode(package['ct'])
-            nonce = base64.b64decode(package['n'])
-            
-            # Recreate ephemeral public key object from received PEM bytes
-            eph_public_key_pem = base64.b64decode(package['eph_pub_pem'])
-            ephemeral_public_key = load_pem_public_key(eph_public_key_pem, backend=default_backend())
-
-            # 1. Shared Secret (ECDH)
-            shared_secret = self.private_key.exchange(ec.ECDH(), ephemeral_public_key)
-
-            # 2. Key Derivation (HKDF)
-            symmetric_key = HKDF(
-                algorithm=hashes.SHA256(),
-                length=32,
-                salt=None,
-                info=b'ECC Vote Encryption'
-            ).derive(shared_secret)
-
-            # 3. AES-GCM Decryption
-            aesgcm = AESGCM(symmetric_key)
-            decrypted_data = aesgcm.decrypt(nonce, ciphertext, None)
-            
-            return decrypted_data.decode('utf-8')
-            
-        except Exception as e:
-            print(f"❌ Decryption error: {e}")
+        return self.decrypt_vote_bytes(encrypted_data).decode('utf-8')
+
+    def decrypt_vote_bytes(self, encrypted_data: str) -> bytes:
+        """Decrypt vote data to raw plaintext bytes (for binary vote payloads)."""
+        plaintext = self.decrypt_votes([encrypted_data])[0]
+        if plaintext is None:
             raise Exception("Failed to decrypt vote data (Possible tampering or key mismatch)")
+        return plaintext
+
+    def decrypt_votes(self, encrypted_list) -> list:
+        """
+        Decrypt a batch of encrypted vote packages in one call.
+
+        Pays the Python-level setup (attribute lookups, bound methods) once
+        for the whole batch instead of once per vote, which is what tallying
+        cost is dominated by besides the ECDH itself. Returns one plaintext
+        bytes entry per input; entries that fail to decrypt come back as
+        None so one corrupted vote cannot sink the rest of the batch.
+        """
+        # Hoist hot lookups out of both loops
+        b64decode = base64.b64decode
+        unpack_len = _EPH_LEN_STRUCT.unpack_from
+        from_public_bytes = X25519PublicKey.from_public_bytes
+
+        # Phase 1: decode and slice every package up front, so the crypto
+        # loop below touches nothing but key objects and raw bytes.
+        parsed = []
+        for encrypted_data in encrypted_list:
+            try:
+                buf = b64decode(encrypted_data)
+                (eph_len,) = unpack_len(buf)
+                eph_end = _EPH_LEN_STRUCT.size + eph_len
+                parsed.append((from_public_bytes(buf[_EPH_LEN_STRUCT.size:eph_end]),
+                               buf[eph_end:eph_end + _NONCE_LEN],
+                               buf[eph_end + _NONCE_LEN:]))
+            except Exception:
+                logger.exception("Decryption error (malformed package)")
+                parsed.append(None)
+
+        # Phase 2: tight crypto loop — one exchange, one derive, one AEAD
+        # open per vote, with no JSON/base64 work interleaved.
+        exchange = self.private_key.exchange
+        hmac_new = hmac.new
+        sha256 = hashlib.sha256
+        plaintexts = []
+        for entry in parsed:
+            if entry is None:
+                plaintexts.append(None)
+                continue
+            ephemeral_public_key, nonce, ciphertext = entry
+            try:
+                # 1. Shared Secret (X25519 Diffie-Hellman)
+                shared_secret = exchange(ephemeral_public_key)
+
+                # 2. Key Derivation (HKDF-SHA256, inlined extract + expand)
+                prk = hmac_new(_HKDF_ZERO_SALT, shared_secret, sha256).digest()
+                symmetric_key = hmac_new(prk, _HKDF_INFO_BLOCK, sha256).digest()
+
+                # 3. ChaCha20-Poly1305 Decryption
+                plaintexts.append(ChaCha20Poly1305(symmetric_key).decrypt(nonce, ciphertext, None))
+
+            except Exception:
+                logger.exception("Decryption error")
+                plaintexts.append(None)
+
+        return plaintexts
     
+    def decrypt_many_parallel(self, encrypted_list, workers=None) -> list:
+        """
+        Decrypt a large batch across threads, one contiguous chunk per worker.
+
+        Threads (not processes) are enough here: cryptography's OpenSSL
+        calls release the GIL during the X25519 exchange and AEAD open, and
+        the private key is read-only after init, so chunks genuinely run in
+        parallel without copying key material to worker processes. Results
+        keep input order, with None for entries that failed to decrypt.
+        """
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(encrypted_list) < 2:
+            return self.decrypt_votes(encrypted_list)
+
+        chunk_size = -(-len(encrypted_list) // workers)  # ceiling division
+        batches = [encrypted_list[i:i + chunk_size]
+                   for i in range(0, len(encrypted_list), chunk_size)]
+        with ThreadPoolExecutor(max_workers=len(batches)) as pool:
+            return [plaintext
+                    for batch in pool.map(self.decrypt_votes, batches)
+                    for plaintext in batch]
+
     def create_voter_hash(self, voter_info: str) -> str:
         """Create an anonymous hash for voter identification."""
-        salt = "voting_anonymity_salt_2024"
-        salted_info = voter_info + salt
-        hash_object = hashlib.sha256(salted_info.encode('utf-8'))
-        return hash_object.hexdigest()[:16]
\ No newline at end of file
+        # BLAKE2b emits exactly the 8 bytes needed (no truncation waste),
+        # takes the anonymity salt as a native parameter instead of extra
+        # input bytes, and outruns SHA-256 in software on x86-64. Output is
+        # the same 16-hex-char ID length as before.
+        return hashlib.blake2b(voter_info.encode('utf-8'),
+                               digest_size=8, salt=b"vote2024").hexdigest()
\ No newline at end of file